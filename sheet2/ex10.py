@@ -1,4 +1,13 @@
+import sys
+
 import numpy as np
+import matplotlib
+
+# Pass --save to render the animation to a video file instead of opening a window
+save = "--save" in sys.argv
+if save:
+    matplotlib.use("Agg")  # headless backend, must be set before importing pyplot
+
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 
@@ -37,40 +46,45 @@ t_fall2 = np.sqrt(2 * h_free / g)
 a_roll2 = g * np.sin(angle)
 s_total = l_incline
 # solve quadratic: s = v0*t + 0.5*a*t^2
-coeff = [0.5 * a_roll2, v_C, -s_total]
-sol = np.roots(coeff)
-t_roll2 = np.max(sol)
+# (a > 0 and c < 0, so the "+" root is the positive one)
+a, b, c = 0.5 * a_roll2, v_C, -s_total
+disc = b * b - 4 * a * c
+t_roll2 = (-b + np.sqrt(disc)) / (2 * a)
 
 T2 = t_fall2 + t_roll2
 
 # Simulation timeline
 t_max = max(T1, T2)
-ts = np.linspace(0, t_max, 300)
+target_fps = 30  # playback frame rate
+interval = 1000 / target_fps  # delay between frames [ms]
+playback_time = 10  # slow-motion playback duration [s]
+frames = int(playback_time * target_fps)
+ts = np.linspace(0, t_max, frames)
 
 
-# Speeds as function of time
-def speed_path1(t):
-    if t < t_roll1:
-        return a_roll * t
-    elif t < T1:
-        tau = t - t_roll1
-        return np.sqrt(v_B**2 + (g * tau) ** 2)
-    else:
-        return v_final
+# Speeds as function of time (evaluated on the whole time grid at once)
+def speeds_path1(ts):
+    m1 = ts < t_roll1
+    m2 = (ts >= t_roll1) & (ts < T1)
+    tau = ts[m2] - t_roll1
+    out = np.full_like(ts, v_final)
+    out[m1] = a_roll * ts[m1]
+    out[m2] = np.hypot(v_B, g * tau)
+    return out
 
 
-def speed_path2(t):
-    if t < t_fall2:
-        return g * t
-    elif t < T2:
-        tau = t - t_fall2
-        return v_C + a_roll2 * tau
-    else:
-        return v_final
+def speeds_path2(ts):
+    m1 = ts < t_fall2
+    m2 = (ts >= t_fall2) & (ts < T2)
+    tau = ts[m2] - t_fall2
+    out = np.full_like(ts, v_final)
+    out[m1] = g * ts[m1]
+    out[m2] = v_C + a_roll2 * tau
+    return out
 
 
-v1 = [speed_path1(t) for t in ts]
-v2 = [speed_path2(t) for t in ts]
+v1 = speeds_path1(ts)
+v2 = speeds_path2(ts)
 
 # --- Animation ---
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
@@ -97,54 +111,57 @@ ax2.set_title("Speed vs. time")
 (line2,) = ax2.plot([], [], "b-", label="Path 2")
 ax2.legend()
 
-v1_data, v2_data, t_data = [], [], []
-
 
-# Position functions (simplified schematic)
-def pos_path1(t):
-    if t < t_roll1:
-        x = 1.0 * t / t_roll1
-        y = -h_roll * (t / t_roll1)
-    elif t < T1:
-        tau = (t - t_roll1) / t_fall1
-        x = 1 + (1 * tau)
-        y = -h_roll - (h - h_roll) * tau
-    else:
-        x, y = 2, -h
+# Positions (simplified schematic), evaluated on the whole time grid at once
+def positions_path1(ts):
+    m1 = ts < t_roll1
+    m2 = (ts >= t_roll1) & (ts < T1)
+    x = np.full_like(ts, 2.0)
+    y = np.full_like(ts, -h)
+    x[m1] = 1.0 * ts[m1] / t_roll1
+    y[m1] = -h_roll * (ts[m1] / t_roll1)
+    tau = (ts[m2] - t_roll1) / t_fall1
+    x[m2] = 1 + (1 * tau)
+    y[m2] = -h_roll - (h - h_roll) * tau
     return x, y
 
 
-def pos_path2(t):
-    if t < t_fall2:
-        tau = t / t_fall2
-        x = 1.0 * tau
-        y = -h_free * tau
-    elif t < T2:
-        tau = (t - t_fall2) / t_roll2
-        x = 1 + 2 * tau
-        y = -h_free - (h - h_free) * tau
-    else:
-        x, y = 3, -h
+def positions_path2(ts):
+    m1 = ts < t_fall2
+    m2 = (ts >= t_fall2) & (ts < T2)
+    x = np.full_like(ts, 3.0)
+    y = np.full_like(ts, -h)
+    tau = ts[m1] / t_fall2
+    x[m1] = 1.0 * tau
+    y[m1] = -h_free * tau
+    tau = (ts[m2] - t_fall2) / t_roll2
+    x[m2] = 1 + 2 * tau
+    y[m2] = -h_free - (h - h_free) * tau
     return x, y
 
 
+x1s, y1s = positions_path1(ts)
+x2s, y2s = positions_path2(ts)
+
+
 # Update function
 def update(frame):
-    t = ts[frame]
-    # ball positions
-    x1, y1 = pos_path1(t)
-    x2, y2 = pos_path2(t)
-    ball1.set_data([x1], [y1])
-    ball2.set_data([x2], [y2])
-    # speed data
-    t_data.append(t)
-    v1_data.append(speed_path1(t))
-    v2_data.append(speed_path2(t))
-    line1.set_data(t_data, v1_data)
-    line2.set_data(t_data, v2_data)
+    # ball positions (one-element views, no per-frame lists)
+    ball1.set_data(x1s[frame : frame + 1], y1s[frame : frame + 1])
+    ball2.set_data(x2s[frame : frame + 1], y2s[frame : frame + 1])
+    # speed data up to the current frame
+    line1.set_data(ts[: frame + 1], v1[: frame + 1])
+    line2.set_data(ts[: frame + 1], v2[: frame + 1])
     return ball1, ball2, line1, line2
 
 
-ani = animation.FuncAnimation(fig, update, frames=len(ts), interval=30, blit=True)
+ani = animation.FuncAnimation(
+    fig, update, frames=frames, interval=interval, blit=True, cache_frame_data=False
+)
 plt.tight_layout()
-plt.show()
+
+if __name__ == "__main__":
+    if save:
+        ani.save("ex10.mp4", fps=target_fps, writer="ffmpeg")
+    else:
+        plt.show()
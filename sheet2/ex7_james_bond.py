@@ -1,6 +1,9 @@
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
+
+# Pass --save to render the animation to a video file instead of opening a window
+save = "--save" in sys.argv
 
 # -----------------------------
 # Parameters
@@ -64,32 +67,65 @@ def calculate_velocity_range():
 # -----------------------------
 # Animation Function
 # -----------------------------
-def animate_jump(v0_kmh):
-    t_vals, x_vals, y_vals = bond_trajectory(v0_kmh)
+# Figure and artists shared by successive animate_jump calls
+_scene = {}
 
-    fig, ax = plt.subplots()
-    ax.set_xlim(0, 30)
-    ax.set_ylim(0, 6)
-    ax.set_xlabel("x (m)")
-    ax.set_ylabel("y (m)")
-    ax.set_title(f"James Bond jumping with v0 = {v0_kmh} km/h")
 
-    # Objects
-    (bond_dot,) = ax.plot([], [], "ro", label="007")
-    (traj_line,) = ax.plot([], [], "r--", lw=1)
-    boat_patch = plt.Rectangle(
-        (boat_x0, 0), boat_length, boat_height, fc="blue", alpha=0.6, label="Boat"
-    )
-    ax.add_patch(boat_patch)
-    status_text = ax.text(
-        0.5, 0.9, "", transform=ax.transAxes, ha="center", fontsize=12, color="darkred"
-    )
+def animate_jump(v0_kmh):
+    # matplotlib is only needed here, so the other functions can be used
+    # without importing it
+    import matplotlib
 
-    ax.legend()
+    if save:
+        matplotlib.use("Agg")  # headless backend, must be set before importing pyplot
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
 
-    # State variables
-    stopped = {"done": False}
-    success = {"success": False}
+    t_vals, x_vals, y_vals = bond_trajectory(v0_kmh)
+
+    # Boat position and stop conditions for every time step
+    x_left, x_right, _, top = boat_position(t_vals)
+    eps = 0.05  # tolerance for landing
+    land = (x_left <= x_vals) & (x_vals <= x_right)
+    land &= (top - eps <= y_vals) & (y_vals <= top)
+    miss = y_vals <= 0
+    stop = land | miss
+    end = int(np.argmax(stop)) if stop.any() else len(t_vals) - 1
+    success = bool(land[end])
+
+    # Reuse the figure and artists of a previous call (e.g. when trying several
+    # v0 values) as long as that figure is still open
+    if "fig" not in _scene or not plt.fignum_exists(_scene["fig"].number):
+        fig, ax = plt.subplots()
+        ax.set_xlim(0, 30)
+        ax.set_ylim(0, 6)
+        ax.set_xlabel("x (m)")
+        ax.set_ylabel("y (m)")
+
+        # Objects
+        (bond_dot,) = ax.plot([], [], "ro", label="007")
+        (traj_line,) = ax.plot([], [], "r--", lw=1)
+        boat_patch = plt.Rectangle(
+            (boat_x0, 0), boat_length, boat_height, fc="blue", alpha=0.6, label="Boat"
+        )
+        ax.add_patch(boat_patch)
+        status_text = ax.text(
+            0.5,
+            0.9,
+            "",
+            transform=ax.transAxes,
+            ha="center",
+            fontsize=12,
+            color="darkred",
+        )
+
+        ax.legend()
+        _scene["fig"], _scene["ax"] = fig, ax
+        _scene["artists"] = bond_dot, traj_line, boat_patch, status_text
+
+    fig, ax = _scene["fig"], _scene["ax"]
+    bond_dot, traj_line, boat_patch, status_text = _scene["artists"]
+    ax.set_title(f"James Bond jumping with v0 = {v0_kmh} km/h")
 
     def init():
         bond_dot.set_data([], [])
@@ -99,43 +135,37 @@ def animate_jump(v0_kmh):
         return bond_dot, traj_line, boat_patch, status_text
 
     def update(frame):
-        if stopped["done"]:
-            return bond_dot, traj_line, boat_patch, status_text
-
-        t = t_vals[frame]
-        x, y = x_vals[frame], y_vals[frame]
-
         # Update Bond
-        bond_dot.set_data([x], [y])
+        bond_dot.set_data(x_vals[frame : frame + 1], y_vals[frame : frame + 1])
         traj_line.set_data(x_vals[:frame], y_vals[:frame])
 
         # Update boat
-        x_left, x_right, _, top = boat_position(t)
-        boat_patch.set_xy((x_left, 0))
-
-        # --- Stop conditions ---
-        eps = 0.05  # tolerance for landing
-        if (x_left <= x <= x_right) and (top - eps <= y <= top):
-            status_text.set_text("Success! 007 landed on the boat.")
-            stopped["done"] = True
-            success["success"] = True
-        elif y <= 0:
-            status_text.set_text("Missed! 007 fell into the water.")
-            stopped["done"] = True
+        boat_patch.set_x(x_left[frame])  # horizontal move only, y stays 0
+
+        # Last frame: show the outcome
+        if frame == end:
+            if success:
+                status_text.set_text("Success! 007 landed on the boat.")
+            elif miss[end]:
+                status_text.set_text("Missed! 007 fell into the water.")
 
         return bond_dot, traj_line, boat_patch, status_text
 
     ani = animation.FuncAnimation(
         fig,
         update,
-        frames=len(t_vals),
+        frames=end + 1,
         init_func=init,
         blit=True,
         interval=dt * 1000,
         repeat=False,
+        cache_frame_data=False,
     )
-    plt.show()
-    return success["success"]
+    if save:
+        ani.save(f"james_bond_{v0_kmh}kmh.mp4", fps=round(1 / dt), writer="ffmpeg")
+    else:
+        plt.show()
+    return success
 
 
 # -----------------------------
@@ -1,6 +1,16 @@
+import sys
+
 import numpy as np
+import matplotlib
+
+# Pass --save to render the animation to a video file instead of opening a window
+save = "--save" in sys.argv
+if save:
+    matplotlib.use("Agg")  # headless backend, must be set before importing pyplot
+
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from matplotlib.lines import Line2D
 
 # --- Physical constants ---
 G = 6.67430e-11  # gravitational constant [m^3/kg/s^2]
@@ -24,8 +34,9 @@ def orbital_period(r):
     return 2 * np.pi * np.sqrt(r**3 / GM)
 
 
+# (T_geo is kept exactly equal to T_earth so the geostationary satellite
+# stays locked to the reference point)
 T_close = orbital_period(r_close_real)
-T_geo = orbital_period(r_geo_real)
 T_far = orbital_period(r_far_real)
 
 # --- Scaling for plotting ---
@@ -37,22 +48,32 @@ r_geo = r_geo_real * scale
 r_far = r_far_real * scale
 
 # --- Time setup ---
-frames = 500
-interval = 30
+target_fps = 30  # playback frame rate
+interval = 1000 / target_fps  # delay between frames [ms]
+playback_time = 15  # playback duration [s]
+frames = int(playback_time * target_fps)
 sim_time = 3 * T_earth  # simulate for 1.5 Earth days
-times = np.linspace(0, sim_time, frames)
+dt = sim_time / (frames - 1)  # simulated time per frame
+frame_idx = np.arange(frames)
 
 
-# --- Position functions ---
-def sat_pos(r, T, t):
-    theta = 2 * np.pi * t / T
-    return r * np.cos(theta), r * np.sin(theta)
+# --- Position function (n: frame index) ---
+def orbit_pos(r, T, n):
+    theta = (2 * np.pi * dt / T) * n  # angle advanced per frame, times n
+    z = r * np.exp(1j * theta)  # cos and sin in a single pass
+    return z.real, z.imag
 
 
-def earth_marker(t):
-    # Position of a reference point on equator (longitude marker)
-    theta = 2 * np.pi * t / T_earth
-    return R_earth * np.cos(theta), R_earth * np.sin(theta)
+# Precompute all positions for every frame in a single vectorized call.
+# Rows: too close, geostationary, too far, and a reference point on the
+# equator (longitude marker) that rotates with the Earth.
+radii = np.array([r_close, r_geo, r_far, R_earth])[:, None]
+periods = np.array([T_close, T_geo, T_far, T_earth])[:, None]
+X, Y = orbit_pos(radii, periods, frame_idx)
+
+# Satellite offsets per frame, shape (frames, 3, 2): close, geo, far
+sat_offsets = np.stack((X[:3].T, Y[:3].T), axis=-1)
+Xm, Ym = X[3], Y[3]
 
 
 # --- Set up figure ---
@@ -66,34 +87,59 @@ ax.set_title("Geostationary Orbit Demo (scaled)")
 earth = plt.Circle((0, 0), R_earth, color="lightblue", zorder=1)
 ax.add_patch(earth)
 
-# Satellites
-(sat_close,) = ax.plot([], [], "ro", label=f"Too close (T={T_close / 3600:.1f} h)")
-(sat_geo,) = ax.plot([], [], "go", label=f"Geostationary (T={T_geo / 3600:.1f} h)")
-(sat_far,) = ax.plot([], [], "bo", label=f"Too far (T={T_far / 3600:.1f} h)")
+# Satellites (one scatter artist for all three)
+# (animated artists are left out of the cached background when blitting)
+sat_colors = ["r", "g", "b"]
+sats = ax.scatter(
+    sat_offsets[0, :, 0], sat_offsets[0, :, 1], c=sat_colors, animated=True
+)
 
 # Earth reference marker
-(marker,) = ax.plot([], [], "kx", markersize=10, label="Reference point")
-ax.legend(loc="upper right")
+(marker,) = ax.plot([], [], "kx", markersize=10, animated=True, label="Reference point")
+
+# Legend entries for the satellites (the scatter itself has a single label)
+sat_labels = [
+    f"Too close (T={T_close / 3600:.1f} h)",
+    f"Geostationary (T={T_geo / 3600:.1f} h)",
+    f"Too far (T={T_far / 3600:.1f} h)",
+]
+sat_handles = [
+    Line2D([], [], color=c, marker="o", linestyle="", label=label)
+    for c, label in zip(sat_colors, sat_labels)
+]
+ax.legend(handles=sat_handles + [marker], loc="upper right")
+
+
+# --- Init function (Earth, legend and axes stay in the static background) ---
+def init():
+    sats.set_offsets(sat_offsets[0])
+    marker.set_data([], [])
+    return sats, marker
 
 
 # --- Update function ---
 def update(frame):
-    t = times[frame]
-
     # Satellite positions
-    x1, y1 = sat_pos(r_close, T_close, t)
-    x2, y2 = sat_pos(r_geo, T_geo, t)
-    x3, y3 = sat_pos(r_far, T_far, t)
-    sat_close.set_data([x1], [y1])
-    sat_geo.set_data([x2], [y2])
-    sat_far.set_data([x3], [y3])
+    sats.set_offsets(sat_offsets[frame])
 
     # Earth reference point
-    xm, ym = earth_marker(t)
-    marker.set_data([xm], [ym])
-
-    return sat_close, sat_geo, sat_far, marker
-
-
-ani = animation.FuncAnimation(fig, update, frames=frames, interval=interval, blit=True)
-plt.show()
+    marker.set_data(Xm[frame : frame + 1], Ym[frame : frame + 1])
+
+    return sats, marker
+
+
+ani = animation.FuncAnimation(
+    fig,
+    update,
+    frames=frames,
+    init_func=init,
+    interval=interval,
+    blit=True,
+    cache_frame_data=False,
+)
+
+if __name__ == "__main__":
+    if save:
+        ani.save("ex14.mp4", fps=target_fps, writer="ffmpeg")
+    else:
+        plt.show()